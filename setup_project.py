@@ -91,16 +91,27 @@ def create_directory_structure():
         "portfolio/index.html": "<!-- Portfolio page -->\n"
     }
     
+    # Create any parent directories not already covered above, once each
+    created_dirs = set(directories)
+    parent_dirs = {
+        Path(filepath).parent
+        for filepath in placeholder_files
+        if str(Path(filepath).parent) not in created_dirs
+    }
+    for parent in parent_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    shell_scripts = []
     for filepath, content in placeholder_files.items():
-        file_path = Path(filepath)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w") as f:
-            f.write(content)
+        Path(filepath).write_text(content)
         print(f"✓ Created {filepath}")
-        
-        # Make shell scripts executable
+
         if filepath.endswith(".sh"):
-            os.chmod(filepath, 0o755)
+            shell_scripts.append(filepath)
+
+    # Make shell scripts executable in one pass
+    for script in shell_scripts:
+        os.chmod(script, 0o755)
     
     print("\n✅ Project structure created successfully!")
     print("\nNext steps:")
@@ -3,95 +3,143 @@ Configuration management for CloudScale Finance ETL
 Loads settings from environment variables and provides defaults
 """
 
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(env_path)
+# Project root, resolved once at import rather than rebuilt per path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
-class Config:
-    """Application configuration settings"""
-    
+@functools.cache
+def _load_env():
+    """Load the .env file once per process (reloads/reimports are no-ops)"""
+    load_dotenv(PROJECT_ROOT / '.env')
+    return True
+
+
+@dataclass(frozen=True)
+class _Config:
+    """Application configuration settings
+
+    Loaded once from the environment via load(); the frozen instance
+    can't be mutated by accident.
+    """
+
     # Environment
-    ENV = os.getenv('ENV', 'development')
-    DEBUG = ENV == 'development'
-    
+    ENV: str
+    DEBUG: bool
+
     # API Configuration
-    ALPHA_VANTAGE_API_KEY = os.getenv('ALPHA_VANTAGE_API_KEY')
-    YAHOO_FINANCE_API_KEY = os.getenv('YAHOO_FINANCE_API_KEY')
-    
+    ALPHA_VANTAGE_API_KEY: Optional[str]
+    YAHOO_FINANCE_API_KEY: Optional[str]
+
     # AWS Configuration
-    AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
-    AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
-    AWS_DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-    S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME', 'cloudscale-finance-etl-data')
-    
+    AWS_ACCESS_KEY_ID: Optional[str]
+    AWS_SECRET_ACCESS_KEY: Optional[str]
+    AWS_DEFAULT_REGION: str
+    S3_BUCKET_NAME: str
+
     # Google Cloud Configuration
-    GCP_PROJECT_ID = os.getenv('GCP_PROJECT_ID')
-    GCP_SERVICE_ACCOUNT_PATH = os.getenv('GCP_SERVICE_ACCOUNT_PATH')
-    BIGQUERY_DATASET_NAME = os.getenv('BIGQUERY_DATASET_NAME', 'financial_data')
-    
+    GCP_PROJECT_ID: Optional[str]
+    GCP_SERVICE_ACCOUNT_PATH: Optional[str]
+    BIGQUERY_DATASET_NAME: str
+
     # Application Settings
-    BATCH_SIZE = int(os.getenv('BATCH_SIZE', '100'))
-    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    
+    BATCH_SIZE: int
+    MAX_RETRIES: int
+    LOG_LEVEL: str
+
     # Monitoring
-    ENABLE_MONITORING = os.getenv('ENABLE_MONITORING', 'true').lower() == 'true'
-    SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
-    ALERT_EMAIL = os.getenv('ALERT_EMAIL')
-    
+    ENABLE_MONITORING: bool
+    SLACK_WEBHOOK_URL: Optional[str]
+    ALERT_EMAIL: Optional[str]
+
     # Data Settings
-    DATA_DIR = Path(__file__).parent.parent.parent / 'data'
-    RAW_DATA_DIR = DATA_DIR / 'raw'
-    PROCESSED_DATA_DIR = DATA_DIR / 'processed'
-    
+    DATA_DIR: Path
+    RAW_DATA_DIR: Path
+    PROCESSED_DATA_DIR: Path
+
     # API Rate Limits
-    ALPHA_VANTAGE_RATE_LIMIT = 5  # calls per minute
-    ALPHA_VANTAGE_DAILY_LIMIT = 500  # calls per day
-    
+    ALPHA_VANTAGE_RATE_LIMIT: int
+    ALPHA_VANTAGE_DAILY_LIMIT: int
+
     @classmethod
-    def validate(cls):
+    def load(cls):
+        """Read the environment (and .env file) into a frozen instance"""
+        _load_env()
+
+        env = os.getenv('ENV', 'development')
+        data_dir = PROJECT_ROOT / 'data'
+
+        return cls(
+            ENV=env,
+            DEBUG=env == 'development',
+            ALPHA_VANTAGE_API_KEY=os.getenv('ALPHA_VANTAGE_API_KEY'),
+            YAHOO_FINANCE_API_KEY=os.getenv('YAHOO_FINANCE_API_KEY'),
+            AWS_ACCESS_KEY_ID=os.getenv('AWS_ACCESS_KEY_ID'),
+            AWS_SECRET_ACCESS_KEY=os.getenv('AWS_SECRET_ACCESS_KEY'),
+            AWS_DEFAULT_REGION=os.getenv('AWS_DEFAULT_REGION', 'us-east-1'),
+            S3_BUCKET_NAME=os.getenv('S3_BUCKET_NAME', 'cloudscale-finance-etl-data'),
+            GCP_PROJECT_ID=os.getenv('GCP_PROJECT_ID'),
+            GCP_SERVICE_ACCOUNT_PATH=os.getenv('GCP_SERVICE_ACCOUNT_PATH'),
+            BIGQUERY_DATASET_NAME=os.getenv('BIGQUERY_DATASET_NAME', 'financial_data'),
+            BATCH_SIZE=int(os.getenv('BATCH_SIZE', '100')),
+            MAX_RETRIES=int(os.getenv('MAX_RETRIES', '3')),
+            LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO'),
+            ENABLE_MONITORING=os.getenv('ENABLE_MONITORING', 'true').lower() == 'true',
+            SLACK_WEBHOOK_URL=os.getenv('SLACK_WEBHOOK_URL'),
+            ALERT_EMAIL=os.getenv('ALERT_EMAIL'),
+            DATA_DIR=data_dir,
+            RAW_DATA_DIR=data_dir / 'raw',
+            PROCESSED_DATA_DIR=data_dir / 'processed',
+            ALPHA_VANTAGE_RATE_LIMIT=5,  # calls per minute
+            ALPHA_VANTAGE_DAILY_LIMIT=500,  # calls per day
+        )
+
+    def validate(self):
         """Validate required configuration settings"""
         errors = []
-        
+
         # Check required API keys
-        if not cls.ALPHA_VANTAGE_API_KEY:
+        if not self.ALPHA_VANTAGE_API_KEY:
             errors.append("ALPHA_VANTAGE_API_KEY is required")
-        
+
         # Check AWS credentials if not in development
-        if cls.ENV != 'development':
-            if not cls.AWS_ACCESS_KEY_ID:
+        if self.ENV != 'development':
+            if not self.AWS_ACCESS_KEY_ID:
                 errors.append("AWS_ACCESS_KEY_ID is required")
-            if not cls.AWS_SECRET_ACCESS_KEY:
+            if not self.AWS_SECRET_ACCESS_KEY:
                 errors.append("AWS_SECRET_ACCESS_KEY is required")
-            if not cls.GCP_PROJECT_ID:
+            if not self.GCP_PROJECT_ID:
                 errors.append("GCP_PROJECT_ID is required")
-        
+
         if errors:
             raise ValueError(f"Configuration errors: {', '.join(errors)}")
-        
-        print(f"✓ Configuration validated for {cls.ENV} environment")
-        
-    @classmethod
-    def display(cls):
+
+        print(f"✓ Configuration validated for {self.ENV} environment")
+
+    def display(self):
         """Display current configuration (hiding sensitive values)"""
         print("\nCurrent Configuration:")
-        print(f"  Environment: {cls.ENV}")
-        print(f"  Debug Mode: {cls.DEBUG}")
-        print(f"  S3 Bucket: {cls.S3_BUCKET_NAME}")
-        print(f"  BigQuery Dataset: {cls.BIGQUERY_DATASET_NAME}")
-        print(f"  Log Level: {cls.LOG_LEVEL}")
-        print(f"  Monitoring Enabled: {cls.ENABLE_MONITORING}")
-        print(f"  Alpha Vantage API Key: {'***' + cls.ALPHA_VANTAGE_API_KEY[-4:] if cls.ALPHA_VANTAGE_API_KEY else 'Not Set'}")
+        print(f"  Environment: {self.ENV}")
+        print(f"  Debug Mode: {self.DEBUG}")
+        print(f"  S3 Bucket: {self.S3_BUCKET_NAME}")
+        print(f"  BigQuery Dataset: {self.BIGQUERY_DATASET_NAME}")
+        print(f"  Log Level: {self.LOG_LEVEL}")
+        print(f"  Monitoring Enabled: {self.ENABLE_MONITORING}")
+        print(f"  Alpha Vantage API Key: {'***' + self.ALPHA_VANTAGE_API_KEY[-4:] if self.ALPHA_VANTAGE_API_KEY else 'Not Set'}")
         print()
 
 
-# Validate configuration on import
+# Single shared instance; importers keep using Config.ATTRIBUTE as before
+Config = _Config.load()
+
+
 if __name__ == "__main__":
     Config.display()
-    Config.validate()
\ No newline at end of file
+    Config.validate()
@@ -0,0 +1,48 @@
+"""
+Filesystem helpers for CloudScale Finance ETL
+Provides scandir-based traversal that avoids redundant stat calls
+"""
+
+import os
+from typing import Iterator
+
+
+def iter_files(root) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield files under a directory using os.scandir
+
+    Unlike os.walk + os.path.isfile/getsize, the yielded DirEntry objects
+    carry cached type and stat information from the directory listing, so
+    callers can check e.is_file() or read e.stat().st_size without issuing
+    an extra stat syscall per file.
+
+    Args:
+        root: Directory to traverse (str or Path)
+
+    Yields:
+        os.DirEntry for each file found (symlinked directories are not
+        followed, so traversal cannot loop)
+    """
+    stack = [os.fspath(root)]
+
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
+
+if __name__ == "__main__":
+    # Quick check: list files under the data directory
+    from src.utils.config import Config
+
+    total_size = 0
+    count = 0
+    for entry in iter_files(Config.DATA_DIR):
+        total_size += entry.stat().st_size
+        count += 1
+
+    print(f"{count} files, {total_size:,} bytes under {Config.DATA_DIR}")
@@ -3,11 +3,12 @@ Logging configuration for CloudScale Finance ETL
 Sets up structured logging with appropriate formatting
 """
 
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 from src.utils.config import Config
 
@@ -15,10 +16,14 @@ from src.utils.config import Config
 def setup_logger(name=None):
     """
     Set up logger with console and file output
-    
+
+    Handlers sit behind a QueueHandler/QueueListener pair, so callers only
+    enqueue records and the actual formatting and disk/console I/O happen
+    on a background thread instead of blocking the caller.
+
     Args:
         name: Logger name (defaults to root logger)
-        
+
     Returns:
         Configured logger instance
     """
@@ -46,22 +51,34 @@ def setup_logger(name=None):
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
+    handlers = [console_handler]
+
     # File handler (only if not in test mode)
     if 'pytest' not in sys.modules:
         log_dir = Path(__file__).parent.parent.parent / 'logs'
         log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f"etl_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = RotatingFileHandler(
+
+        # Let the handler roll the file at midnight instead of baking the
+        # date into the filename ourselves
+        log_file = log_dir / 'etl.log'
+        file_handler = TimedRotatingFileHandler(
             log_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
+            when='midnight',
             backupCount=5
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-    
+        handlers.append(file_handler)
+
+    # Put the real handlers behind a queue so log calls never block on I/O
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+
+    # Flush any queued records on interpreter shutdown
+    atexit.register(listener.stop)
+
     return logger
 
 
@@ -70,27 +87,29 @@ logger = setup_logger('cloudscale_etl')
 
 
 # Example usage functions
+# All helpers use %-style lazy formatting so arguments are only
+# interpolated when the record actually passes the level filter
 def log_start(task_name):
     """Log the start of a task"""
-    logger.info(f"Starting {task_name}")
-    
+    logger.info("Starting %s", task_name)
+
 
 def log_success(task_name, message=""):
     """Log successful completion of a task"""
-    msg = f"Successfully completed {task_name}"
     if message:
-        msg += f": {message}"
-    logger.info(msg)
+        logger.info("Successfully completed %s: %s", task_name, message)
+    else:
+        logger.info("Successfully completed %s", task_name)
 
 
 def log_error(task_name, error):
     """Log an error with context"""
-    logger.error(f"Error in {task_name}: {str(error)}", exc_info=True)
+    logger.error("Error in %s: %s", task_name, error, exc_info=True)
 
 
 def log_metric(metric_name, value):
     """Log a metric value"""
-    logger.info(f"METRIC - {metric_name}: {value}")
+    logger.info("METRIC - %s: %s", metric_name, value)
 
 
 if __name__ == "__main__":